@@ -3,6 +3,7 @@ import os
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
@@ -24,17 +25,58 @@ def merge_basenames(files: List[FilePath]) -> Path:
     dirname: Path = files[0].parent
     ext = files[0].suffix
 
-    basenames = (file.stem for file in files)
-
-    basenames_str = ",".join(f"{len(b)}:{b}" for b in basenames)
-
     # We use hashes to prevent too-long filenames, see issue #123:
     # https://github.com/jeertmans/manim-slides/issues/123
-    basename = hashlib.sha256(basenames_str.encode()).hexdigest()
+    # Basenames are fed one by one, as "len:basename,", instead of being joined first.
+    h = hashlib.blake2b(digest_size=32)
+
+    for file in files:
+        stem = file.stem.encode()
+        h.update(b"%d:%b," % (len(stem), stem))
+
+    basename = h.hexdigest()
 
     return dirname.joinpath(basename + ext)
 
 
+def concat_files(files: List[Path], dest_path: Path) -> None:
+    """
+    Concatenate video files into one, without re-encoding them.
+    """
+    f = tempfile.NamedTemporaryFile(mode="w", delete=False)
+    f.writelines(f"file '{os.path.abspath(path)}'\n" for path in files)
+    f.close()
+
+    command: List[str] = [
+        FFMPEG_BIN,
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        f.name,
+        "-c",
+        "copy",
+        str(dest_path),
+        "-y",
+    ]
+    logger.debug(" ".join(command))
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output, error = process.communicate()
+    os.unlink(f.name)
+
+    if output:
+        logger.debug(output.decode())
+
+    if error:
+        logger.debug(error.decode())
+
+    if not dest_path.exists():
+        raise ValueError(
+            "could not properly concatenate animations, use `-v INFO` for more details"
+        )
+
+
 class Key(BaseModel):  # type: ignore
     """Represents a list of key codes, with optionally a name."""
 
@@ -177,16 +219,27 @@ class PresentationConfig(BaseModel):  # type: ignore
         """
         Copy the files to a given directory.
         """
+        # Listing the directory once is cheaper than checking each file
+        existing: Set[str] = set()
+        if use_cached:
+            try:
+                with os.scandir(dest) as entries:
+                    existing = {entry.name for entry in entries}
+            except FileNotFoundError:
+                pass
+
         n = len(self.files)
         for i in range(n):
             file = self.files[i]
             dest_path = dest / self.files[i].name
             self.files[i] = dest_path
-            if use_cached and dest_path.exists():
+            if dest_path.name in existing:
                 logger.debug(f"Skipping copy of {file}, using cached copy")
                 continue
             logger.debug(f"Copying {file} to {dest_path}")
-            shutil.copy(file, dest_path)
+            # Only contents matter, so we do not copy permission bits
+            shutil.copyfile(file, dest_path)
+            existing.add(dest_path.name)
 
         return self
 
@@ -195,9 +248,12 @@ class PresentationConfig(BaseModel):  # type: ignore
     ) -> "PresentationConfig":
         """
         Concatenate animations such that each slide contains one animation.
+
+        Slides are concatenated in parallel, each by its own FFmpeg process.
         """
 
         dest_paths = []
+        to_concat: Dict[Path, List[Path]] = {}
 
         for i, slide_config in enumerate(self.slides):
             files = self.files[slide_config.slides_slice]
@@ -213,43 +269,16 @@ class PresentationConfig(BaseModel):  # type: ignore
                     logger.debug(f"Concatenated animations already exist for slide {i}")
                     continue
 
-                f = tempfile.NamedTemporaryFile(mode="w", delete=False)
-                f.writelines(f"file '{os.path.abspath(path)}'\n" for path in files)
-                f.close()
-
-                command: List[str] = [
-                    FFMPEG_BIN,
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    f.name,
-                    "-c",
-                    "copy",
-                    str(dest_path),
-                    "-y",
-                ]
-                logger.debug(" ".join(command))
-                process = subprocess.Popen(
-                    command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                )
-                output, error = process.communicate()
-
-                if output:
-                    logger.debug(output.decode())
-
-                if error:
-                    logger.debug(error.decode())
-
-                if not dest_path.exists():
-                    raise ValueError(
-                        "could not properly concatenate animations, use `-v INFO` for more details"
-                    )
+                to_concat[dest_path] = files
 
             else:
                 dest_paths.append(files[0])
 
+        if to_concat:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                # Consuming results re-raises any exception from the workers
+                list(executor.map(concat_files, to_concat.values(), to_concat.keys()))
+
         self.files = dest_paths
 
         if dest:
@@ -1,10 +1,12 @@
 import os
 import platform
 import sys
+import threading
 import time
+from collections import OrderedDict, deque
 from enum import Enum, IntEnum, auto, unique
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Collection, Deque, Dict, List, Optional, Tuple, Union
 
 import click
 import cv2
@@ -30,6 +32,9 @@ os.environ.pop(
 WINDOW_NAME = "Manim Slides"
 WINDOW_INFO_NAME = f"{WINDOW_NAME}: Info"
 WINDOWS = platform.system() == "Windows"
+MAX_FRAME_BUFFERS = 3  # Number of frame buffers reused by each presentation
+MAX_OPEN_CAPS = 3  # Number of video files kept open by each presentation
+FRAME_CACHE_MAX_BYTES = 512 * 1024**2  # Memory for caching decoded frames
 
 
 class AspectRatio(Enum):
@@ -60,12 +65,116 @@ class State(IntEnum):
     END = auto()
 
     def __str__(self) -> str:
-        return self.name.capitalize()
+        return STATE_NAMES[self]
+
+
+# Defined outside of State, as enum class attributes would become members
+STATE_NAMES = {state: state.name.capitalize() for state in State}
 
 
 def now() -> float:
-    """Returns time.time() in seconds."""
-    return time.time()
+    """
+    Returns time.perf_counter() in seconds.
+
+    Unlike time.time(), it is monotonic, so a clock adjustment cannot
+    produce a negative lag, and it has a high resolution on all platforms.
+    """
+    return time.perf_counter()
+
+
+def open_cap(file: str) -> cv2.VideoCapture:
+    """Opens a video file for reading."""
+    cap = cv2.VideoCapture(file)
+    # Keep at most one decoded frame in the backend's buffer, if supported
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+
+def grab_frames(cap: cv2.VideoCapture, n: int) -> bool:
+    """
+    Skips the next n frames of a video capture.
+
+    Frames are grabbed but never retrieved, which avoids
+    converting and copying them to images.
+    Returns False if the end of the video was reached.
+    """
+    for _ in range(n):
+        if not cap.grab():
+            return False
+
+    return True
+
+
+def rewind_cap(cap: cv2.VideoCapture) -> None:
+    """Sets a video capture to its first frame, unless it is already there."""
+    if cap.get(cv2.CAP_PROP_POS_FRAMES) != 0:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+
+class FrameCache:
+    """
+    Least recently used cache of decoded frames, bounded in memory.
+
+    Frames are cached per video file, and only for complete videos, so that
+    a video is either entirely read from memory or decoded, never both.
+    The cache is shared by all presentations, which may use the same files.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.frames: "OrderedDict[str, List[np.ndarray]]" = OrderedDict()
+        self.sizes: Dict[str, int] = {}
+
+    @property
+    def free_nbytes(self) -> int:
+        """Returns the number of bytes that can be cached without evicting files."""
+        return self.max_bytes - self.nbytes
+
+    def get(self, file: str) -> Optional[List[np.ndarray]]:
+        """Returns the frames of given file, if cached."""
+        frames = self.frames.get(file)
+        if frames is not None:
+            self.frames.move_to_end(file)
+        return frames
+
+    def put(self, file: str, frames: List[np.ndarray]) -> None:
+        """Caches the frames of given file, evicting older files if needed."""
+        nbytes = sum(frame.nbytes for frame in frames)
+        self.pop(file)
+
+        if self.make_room(nbytes):
+            self.frames[file] = frames
+            self.sizes[file] = nbytes
+            self.nbytes += nbytes
+
+    def make_room(self, nbytes: int, keep: Collection[str] = ()) -> bool:
+        """
+        Evicts least recently used files, but the ones to keep, until given
+        number of bytes fits in the cache.
+
+        Returns False, without evicting anything, if it cannot fit.
+        """
+        kept_nbytes = sum(self.sizes[file] for file in keep if file in self.sizes)
+
+        if kept_nbytes + nbytes > self.max_bytes:
+            return False
+
+        for file in [file for file in self.frames if file not in keep]:
+            if nbytes <= self.free_nbytes:
+                break
+            self.pop(file)
+
+        return True
+
+    def pop(self, file: str) -> None:
+        """Removes the frames of given file from the cache, if present."""
+        if file in self.frames:
+            del self.frames[file]
+            self.nbytes -= self.sizes.pop(file)
+
+
+FRAME_CACHE = FrameCache(FRAME_CACHE_MAX_BYTES)
 
 
 class Presentation:
@@ -80,11 +189,27 @@ class Presentation:
 
         self.loaded_animation_cap: int = -1
         self.cap = None  # cap = cv2.VideoCapture
+        self.caps: "OrderedDict[str, cv2.VideoCapture]" = OrderedDict()
+        self.caps_lock = threading.Lock()
+        self.fps_by_file: Dict[str, float] = {}
+
+        self.prefetch_file: Optional[str] = None
+        self.prefetch_event = threading.Event()
+        self.prefetch_thread: Optional[threading.Thread] = None
+        self.prefetch_stopped: bool = False
 
         self.reverse: bool = False
         self.reversed_animation: int = -1
 
         self.lastframe: Optional[np.ndarray] = None
+        self.frame_buffers: Dict[int, np.ndarray] = {}
+        self.frames_shown: Dict[int, int] = {}  # Sent to the window, not yet displayed
+        self.frame_buffers_lock = threading.Lock()
+
+        self.cached_frames: Optional[List[np.ndarray]] = None
+        self.cached_frame_index: int = 0
+        self.recorded_frames: Optional[List[np.ndarray]] = None
+        self.recorded_nbytes: int = 0
 
         self.reset()
 
@@ -169,32 +294,129 @@ class Presentation:
         return self.slides[-1]
 
     def release_cap(self) -> None:
-        """Releases current Video Capture, if existing."""
-        if self.cap is not None:
-            self.cap.release()
+        """Releases all opened Video Captures, if existing."""
+        with self.caps_lock:
+            for cap in self.caps.values():
+                cap.release()
+
+            self.caps.clear()
+            self.cap = None
+            self.loaded_animation_cap = -1
 
-        self.loaded_animation_cap = -1
+            # Captures being prefetched must not be added after this point
+            self.prefetch_file = None
+            self.prefetch_stopped = True
+
+        self.prefetch_event.set()
+
+    def release_old_caps(self) -> None:
+        """
+        Releases least recently used Video Captures, but the current one,
+        until at most MAX_OPEN_CAPS remain opened.
+
+        Must be called while holding the caps lock.
+        """
+        for file in list(self.caps):
+            if len(self.caps) <= MAX_OPEN_CAPS:
+                break
+            if self.caps[file] is not self.cap:
+                self.caps.pop(file).release()
+
+    def animation_file(self, animation: int) -> str:
+        """Returns the video file of given animation, taking reverse into account."""
+        file: str = str(self.files[animation])
+
+        if self.reverse:
+            file = "{}_reversed{}".format(*os.path.splitext(file))
+
+        return file
 
     def load_animation_cap(self, animation: int) -> None:
-        """Loads video file of given animation."""
+        """
+        Loads video file of given animation.
+
+        The last few opened files are kept open, so that going back to one of
+        them, e.g., when looping or rewinding, does not require to re-open it.
+        The file of the next animation is opened ahead of time, in the background.
+        """
         # We must load a new VideoCapture file if:
         if (self.loaded_animation_cap != animation) or (
             self.reverse and self.reversed_animation != animation
         ):  # cap already loaded
             logger.debug(f"Loading new cap for animation #{animation}")
 
-            self.release_cap()
-
-            file: str = str(self.files[animation])
+            file = self.animation_file(animation)
 
             if self.reverse:
-                file = "{}_reversed{}".format(*os.path.splitext(file))
                 self.reversed_animation = animation
 
             self.current_file = file
 
-            self.cap = cv2.VideoCapture(str(file))
-            self.loaded_animation_cap = animation
+            with self.caps_lock:
+                cap = self.caps.pop(file, None)
+
+                if cap is None:
+                    cap = open_cap(file)
+                else:
+                    # Reset video to position zero if it has been played before
+                    rewind_cap(cap)
+
+                self.caps[file] = cap
+                self.cap = cap
+                self.loaded_animation_cap = animation
+                self.release_old_caps()
+
+            self.start_loop_cache()
+
+            self.prefetch_cap(animation - 1 if self.reverse else animation + 1)
+
+    def prefetch_cap(self, animation: int) -> None:
+        """Requests the video file of given animation to be opened in the background."""
+        if not 0 <= animation < len(self.files):
+            return
+
+        with self.caps_lock:
+            self.prefetch_file = self.animation_file(animation)
+            self.prefetch_stopped = False
+
+            if self.prefetch_thread is None:
+                self.prefetch_thread = threading.Thread(
+                    target=self.prefetch_caps, daemon=True
+                )
+                self.prefetch_thread.start()
+
+        self.prefetch_event.set()
+
+    def prefetch_caps(self) -> None:
+        """
+        Opens requested video files, until captures are released.
+
+        Opening a file probes its format and initializes the decoder, which
+        would otherwise cause a visible hitch when moving to the next animation.
+        """
+        while True:
+            self.prefetch_event.wait()
+            self.prefetch_event.clear()
+
+            with self.caps_lock:
+                if self.prefetch_stopped:
+                    self.prefetch_thread = None
+                    return
+
+                file = self.prefetch_file
+                if file is None or file in self.caps:
+                    continue
+
+            logger.debug(f"Prefetching cap for file {file}")
+            cap = open_cap(file)
+
+            with self.caps_lock:
+                # Was released, or loaded, in the meantime
+                if self.prefetch_stopped or file in self.caps:
+                    cap.release()
+                else:
+                    self.caps[file] = cap
+                    self.release_old_caps()
 
     @property
     def current_cap(self) -> cv2.VideoCapture:
@@ -212,8 +434,51 @@ class Presentation:
         else:
             self.current_animation = self.current_slide.start_animation
 
-        cap = self.current_cap
-        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        rewind_cap(self.current_cap)
+        self.start_loop_cache()
+
+    def start_loop_cache(self) -> None:
+        """
+        Prepares the loop cache when the loaded animation (re)starts from
+        its first frame.
+
+        Frames of loops are kept in memory the first time they are played,
+        if they fit in the frame cache, so that the next loops (possibly from
+        other presentations using the same file) do not decode them again.
+        Frames are recorded in the free part of the cache, after evicting
+        files of other slides if needed.
+        """
+        self.cached_frames = FRAME_CACHE.get(self.current_file)
+        self.cached_frame_index = 0
+        self.recorded_frames = None
+        self.recorded_nbytes = 0
+
+        if (
+            self.cached_frames is not None
+            or self.reverse
+            or not self.current_slide.is_loop()
+        ):
+            return
+
+        cap = self.cap
+        nbytes = int(
+            cap.get(cv2.CAP_PROP_FRAME_COUNT)
+            * cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+            * cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+            * 3
+        )
+
+        # Files of the same loop must not evict each other, or they would be
+        # recorded again on every iteration, without ever being read from memory
+        slide = self.current_slide
+        loop_files = {
+            self.animation_file(animation)
+            for animation in range(slide.start_animation, slide.end_animation)
+        }
+
+        if FRAME_CACHE.make_room(nbytes, keep=loop_files):
+            logger.debug(f"Caching frames of file {self.current_file}")
+            self.recorded_frames = []
 
     def cancel_reverse(self) -> None:
         """Cancels any effet produced by a reversed slide."""
@@ -221,7 +486,7 @@ class Presentation:
             logger.debug("Cancelling effects from previous 'reverse' action'")
             self.reverse = False
             self.reversed_animation = -1
-            self.release_cap()
+            self.loaded_animation_cap = -1
 
     def reverse_current_slide(self) -> None:
         """Reverses current slide."""
@@ -252,14 +517,25 @@ class Presentation:
 
     @property
     def fps(self) -> int:
-        """Returns the number of frames per second of the current video."""
-        fps = self.current_cap.get(cv2.CAP_PROP_FPS)
-        if fps == 0:
-            logger.warn(
-                f"Something is wrong with video file {self.current_file}, as the fps returned by frame {self.current_frame_number} is 0"
-            )
-        # TODO: understand why we sometimes get 0 fps
-        return max(fps, 1)  # type: ignore
+        """
+        Returns the number of frames per second of the current video.
+
+        It is only queried once per video file, as it is needed on every frame.
+        """
+        cap = self.current_cap
+        fps = self.fps_by_file.get(self.current_file)
+
+        if fps is None:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+            if fps == 0:
+                logger.warn(
+                    f"Something is wrong with video file {self.current_file}, as the fps returned by frame {self.current_frame_number} is 0"
+                )
+                # TODO: understand why we sometimes get 0 fps
+                return 1
+            self.fps_by_file[self.current_file] = fps
+
+        return fps  # type: ignore
 
     def reset(self) -> None:
         """Rests current presentation."""
@@ -297,7 +573,85 @@ class Presentation:
     @property
     def current_frame_number(self) -> int:
         """Returns current frame number."""
-        return int(self.current_cap.get(cv2.CAP_PROP_POS_FRAMES))
+        cap = self.current_cap
+        if self.cached_frames is not None:
+            return self.cached_frame_index
+        return int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+
+    def use_frame(self, frame: np.ndarray) -> None:
+        """
+        Marks a frame as sent to the window, so that its buffer is not reused
+        until the frame is released. Frames that are not buffers are ignored.
+        """
+        with self.frame_buffers_lock:
+            key = id(frame)
+            if key in self.frame_buffers:
+                self.frames_shown[key] = self.frames_shown.get(key, 0) + 1
+
+    def release_frame(self, frame: np.ndarray) -> None:
+        """
+        Marks a frame as displayed, once for every time it was used.
+
+        Can be called from any thread.
+        """
+        with self.frame_buffers_lock:
+            key = id(frame)
+            count = self.frames_shown.get(key, 0)
+            if count > 1:
+                self.frames_shown[key] = count - 1
+            elif count == 1:
+                del self.frames_shown[key]
+
+    def get_free_buffer(self) -> Optional[np.ndarray]:
+        """Returns a buffer to decode the next frame into, if any is free."""
+        with self.frame_buffers_lock:
+            for key, buffer in self.frame_buffers.items():
+                # The last frame must be kept, e.g., to be shown when paused
+                if key not in self.frames_shown and buffer is not self.lastframe:
+                    return buffer
+
+        return None
+
+    def read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Reads the next frame from the current video.
+
+        Frames are decoded in-place into a few buffers, reused once the window
+        has displayed them, so that no new array is allocated per frame and a
+        frame is never overwritten before it is displayed.
+
+        If the animation is in the frame cache, frames are read from memory instead.
+        """
+        cap = self.current_cap
+
+        if self.cached_frames is not None:
+            if self.cached_frame_index < len(self.cached_frames):
+                frame = self.cached_frames[self.cached_frame_index]
+                self.cached_frame_index += 1
+                return True, frame
+            return False, None
+
+        buffer = self.get_free_buffer()
+        still_playing, frame = cap.read(buffer)
+
+        if still_playing and frame is not buffer:  # A new array was allocated
+            with self.frame_buffers_lock:
+                if buffer is not None:  # Reallocated, e.g., for another size
+                    del self.frame_buffers[id(buffer)]
+                if len(self.frame_buffers) < MAX_FRAME_BUFFERS:
+                    self.frame_buffers[id(frame)] = frame
+
+        if self.recorded_frames is not None:
+            if not still_playing:
+                FRAME_CACHE.put(self.current_file, self.recorded_frames)
+                self.recorded_frames = None
+            elif self.recorded_nbytes + frame.nbytes <= FRAME_CACHE.free_nbytes:
+                self.recorded_frames.append(frame.copy())
+                self.recorded_nbytes += frame.nbytes
+            else:  # Does not fit in the cache, after all
+                self.recorded_frames = None
+
+        return still_playing, frame
 
     def update_state(self, state: State) -> Tuple[np.ndarray, State]:
         """
@@ -306,41 +660,39 @@ class Presentation:
         It does this by reading the video information and checking if the state is still correct.
         It returns the frame to show (lastframe) and the new state.
         """
-        if state == State.PAUSED:
+        if state in (State.PAUSED, State.WAIT, State.END):
+            # Nothing to decode, the frame to show remains the same
             if self.lastframe is None:
-                _, self.lastframe = self.current_cap.read()
+                _, self.lastframe = self.read_frame()
             return self.lastframe, state
-        still_playing, frame = self.current_cap.read()
+        still_playing, frame = self.read_frame()
         if still_playing:
             self.lastframe = frame
-        elif state == state.WAIT or state == state.PAUSED:  # type: ignore
             return self.lastframe, state
-        elif self.current_slide.is_last() and self.current_slide.terminated:
+
+        slide = self.current_slide
+
+        if slide.is_last() and slide.terminated:
             return self.lastframe, State.END
         else:  # not still playing
             if self.is_last_animation:
-                if self.current_slide.is_slide():
+                if slide.is_slide():
                     state = State.WAIT
-                elif self.current_slide.is_loop():
+                elif slide.is_loop():
                     if self.reverse:
                         state = State.WAIT
                     else:
-                        self.current_animation = self.current_slide.start_animation
+                        self.current_animation = slide.start_animation
                         state = State.PLAYING
                         self.rewind_current_slide()
-                elif self.current_slide.is_last():
-                    self.current_slide.terminated = True
-            elif (
-                self.current_slide.is_last()
-                and self.current_slide.end_animation == self.current_animation
-            ):
+                elif slide.is_last():
+                    slide.terminated = True
+            elif slide.is_last() and slide.end_animation == self.current_animation:
                 state = State.WAIT
             else:
                 # Play next video!
                 self.current_animation = self.next_animation
                 self.load_animation_cap(self.current_animation)
-                # Reset video to position zero if it has been played before
-                self.current_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
 
         return self.lastframe, state
 
@@ -361,6 +713,7 @@ class Display(QThread):  # type: ignore
         skip_all: bool = False,
         record_to: Optional[str] = None,
         exit_after_last_slide: bool = False,
+        show_info_window: bool = False,
         start_at_scene_number: Optional[int] = None,
         start_at_slide_number: Optional[int] = None,
         start_at_animation_number: Optional[int] = None,
@@ -372,9 +725,13 @@ class Display(QThread):  # type: ignore
         self.skip_all = skip_all
         self.record_to = record_to
         self.recordings: List[Tuple[str, int, int]] = []
+        self.show_info_window = show_info_window
 
         self.state = State.PLAYING
         self.lastframe: Optional[np.ndarray] = None
+        self.last_shown_frame: Optional[np.ndarray] = None
+        self.shown_frames: Deque[np.ndarray] = deque()  # Not yet displayed
+        self.last_info: Dict[str, Any] = {}
 
         self.__current_presentation_index = 0
         self.current_presentation_index = start_at_scene_number  # type: ignore
@@ -386,6 +743,7 @@ class Display(QThread):  # type: ignore
         self.run_flag = True
 
         self.key = -1
+        self.key_event = threading.Event()
         self.exit_after_last_slide = exit_after_last_slide
 
     def __len__(self) -> int:
@@ -399,8 +757,9 @@ class Display(QThread):  # type: ignore
     def current_presentation_index(self, value: Optional[int]) -> None:
         if value is not None:
             if -len(self) <= value < len(self):
-                self.__current_presentation_index = value
+                # Captures of the presentation being left are not needed anymore
                 self.current_presentation.release_cap()
+                self.__current_presentation_index = value
                 self.change_presentation_sigal.emit()
             else:
                 logger.error(
@@ -443,11 +802,21 @@ class Display(QThread):  # type: ignore
                     self.state = State.PLAYING
 
             self.handle_key()
-            self.show_video()
-            self.show_info()
+
+            # Key handling may change the current presentation
+            pres = self.current_presentation
+            self.show_video(pres)
+            if self.show_info_window:
+                self.show_info(pres)
+
+            if self.run_flag and self.state != State.PLAYING and self.record_to is None:
+                # Frame is not changing, so we sleep until a key is pressed
+                self.key_event.wait()
+                self.key_event.clear()
+                continue
 
             lag = now() - last_time
-            sleep_time = 1 / self.current_presentation.fps
+            sleep_time = 1 / pres.fps
 
             logger.log(
                 5,
@@ -465,8 +834,10 @@ class Display(QThread):  # type: ignore
 
             sleep_time = max(sleep_time - lag, 0)
             time.sleep(sleep_time)
-            last_time = now()
-        self.current_presentation.release_cap()
+
+        # Presentations not played yet have their first capture opened
+        for presentation in self.presentations:
+            presentation.release_cap()
 
         if self.record_to is not None:
             self.record_movie()
@@ -480,9 +851,13 @@ class Display(QThread):  # type: ignore
         )
         file, frame_number, fps = self.recordings[0]
 
+        # Frames are recorded (mostly) in order, so we avoid seeking
+        # by reading forward, and reusing the last frame if it repeats.
+        position = max(frame_number - 1, 0)
         cap = cv2.VideoCapture(file)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number - 1)
+        cap.set(cv2.CAP_PROP_POS_FRAMES, position)
         _, frame = cap.read()
+        position += 1
 
         w, h = frame.shape[:2]
         fourcc = cv2.VideoWriter_fourcc(*"XVID")
@@ -497,43 +872,79 @@ class Display(QThread):  # type: ignore
                 cap.release()
                 file = _file
                 cap = cv2.VideoCapture(_file)
+                position = 0
+
+            index = max(frame_number - 1, 0)
+
+            if index != position - 1:
+                if index < position:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+                else:
+                    grab_frames(cap, index - position)
+
+                _, frame = cap.read()
+                position = index + 1
 
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number - 1)
-            _, frame = cap.read()
             out.write(frame)
 
         cap.release()
         out.release()
 
-    def show_video(self) -> None:
-        """Shows updated video."""
+    def show_video(self, pres: Presentation) -> None:
+        """
+        Shows updated video of the given (current) presentation.
+
+        The frame is only sent to the window if it is a new one, e.g., not when paused.
+        """
         if self.record_to is not None:
-            pres = self.current_presentation
             self.recordings.append(
                 (pres.current_file, pres.current_frame_number, pres.fps)
             )
 
         frame: np.ndarray = self.lastframe
-        self.change_video_signal.emit(frame)
-
-    def show_info(self) -> None:
-        """Shows updated information about presentations."""
-        self.change_info_signal.emit(
-            {
-                "animation": self.current_presentation.current_animation,
-                "state": self.state,
-                "slide_index": self.current_presentation.current_slide.number,
-                "n_slides": len(self.current_presentation.slides),
-                "type": self.current_presentation.current_slide.type,
-                "scene_index": self.current_presentation_index + 1,
-                "n_scenes": len(self.presentations),
-            }
-        )
+
+        if frame is not self.last_shown_frame:
+            self.last_shown_frame = frame
+
+            for presentation in self.presentations:
+                presentation.use_frame(frame)
+
+            self.shown_frames.append(frame)
+            self.change_video_signal.emit(frame)
+
+    @Slot()
+    def release_shown_frame(self) -> None:
+        """Releases the oldest frame sent to the window, once it is displayed."""
+        frame = self.shown_frames.popleft()
+        for presentation in self.presentations:
+            presentation.release_frame(frame)
+
+    def show_info(self, pres: Presentation) -> None:
+        """
+        Shows updated information about presentations, given the current one.
+
+        Information is only sent to the info window if it changed since last call.
+        """
+        slide = pres.current_slide
+        info = {
+            "animation": pres.current_animation,
+            "state": self.state,
+            "slide_index": slide.number,
+            "n_slides": len(pres.slides),
+            "type": slide.type,
+            "scene_index": self.current_presentation_index + 1,
+            "n_scenes": len(self.presentations),
+        }
+
+        if info != self.last_info:
+            self.last_info = info
+            self.change_info_signal.emit(info)
 
     @Slot(int)
     def set_key(self, key: int) -> None:
         """Sets the next key to be handled."""
         self.key = key
+        self.key_event.set()
 
     def handle_key(self) -> None:
         """Handles key strokes."""
@@ -547,7 +958,9 @@ class Display(QThread):  # type: ignore
         elif self.state == State.PAUSED and self.config.PLAY_PAUSE.match(key):
             self.state = State.PLAYING
         elif self.state == State.WAIT and (
-            self.config.CONTINUE.match(key) or self.config.PLAY_PAUSE.match(key)
+            self.config.CONTINUE.match(key)
+            or self.config.PLAY_PAUSE.match(key)
+            or self.skip_all
         ):
             self.current_presentation.load_next_slide()
             self.state = State.PLAYING
@@ -579,6 +992,7 @@ class Display(QThread):  # type: ignore
     def stop(self) -> None:
         """Stops current thread, without doing anything after."""
         self.run_flag = False
+        self.key_event.set()
         self.wait()
 
 
@@ -603,23 +1017,40 @@ class Info(QWidget):  # type: ignore
         self.layout.addWidget(self.typeLabel, 2, 0)
         self.layout.addWidget(self.sceneLabel, 2, 1)
 
+        self.last_info: Optional[Dict[str, Union[str, int]]] = None
         self.update_info({})
 
     @Slot(dict)
     def update_info(self, info: Dict[str, Union[str, int]]) -> None:
-        self.animationLabel.setText("Animation: {}".format(info.get("animation", "na")))
-        self.stateLabel.setText("State: {}".format(info.get("state", "unknown")))
-        self.slideLabel.setText(
-            "Slide: {}/{}".format(
-                info.get("slide_index", "na"), info.get("n_slides", "na")
+        """Updates the labels whose values changed since last update."""
+        last_info = self.last_info
+        self.last_info = info
+
+        def changed(*keys: str) -> bool:
+            return last_info is None or any(
+                info.get(key) != last_info.get(key) for key in keys
             )
-        )
-        self.typeLabel.setText("Slide Type: {}".format(info.get("type", "unknown")))
-        self.sceneLabel.setText(
-            "Scene: {}/{}".format(
-                info.get("scene_index", "na"), info.get("n_scenes", "na")
+
+        if changed("animation"):
+            self.animationLabel.setText(
+                "Animation: {}".format(info.get("animation", "na"))
+            )
+        if changed("state"):
+            self.stateLabel.setText("State: {}".format(info.get("state", "unknown")))
+        if changed("slide_index", "n_slides"):
+            self.slideLabel.setText(
+                "Slide: {}/{}".format(
+                    info.get("slide_index", "na"), info.get("n_slides", "na")
+                )
+            )
+        if changed("type"):
+            self.typeLabel.setText("Slide Type: {}".format(info.get("type", "unknown")))
+        if changed("scene_index", "n_scenes"):
+            self.sceneLabel.setText(
+                "Scene: {}/{}".format(
+                    info.get("scene_index", "na"), info.get("n_scenes", "na")
+                )
             )
-        )
 
 
 class InfoThread(QThread):  # type: ignore
@@ -639,6 +1070,7 @@ class InfoThread(QThread):  # type: ignore
 
 class App(QWidget):  # type: ignore
     send_key_signal = Signal(int)
+    release_frame_signal = Signal()
 
     def __init__(
         self,
@@ -649,6 +1081,7 @@ class App(QWidget):  # type: ignore
         aspect_ratio: AspectRatio = AspectRatio.auto,
         resize_mode: Qt.TransformationMode = Qt.SmoothTransformation,
         background_color: str = "black",
+        show_info_window: bool = False,
         **kwargs: Any,
     ):
         super().__init__()
@@ -659,6 +1092,7 @@ class App(QWidget):  # type: ignore
 
         # create the video capture thread
         kwargs["config"] = config
+        kwargs["show_info_window"] = show_info_window
         self.thread = Display(*args, **kwargs)
 
         self.display_width, self.display_height = self.thread.current_resolution
@@ -681,24 +1115,29 @@ class App(QWidget):  # type: ignore
 
         self.pixmap = QPixmap(self.width(), self.height())
         self.label.setPixmap(self.pixmap)
+        self.image: Optional[QImage] = None
         self.label.setMinimumSize(1, 1)
 
         # create the info dialog
-        self.info = Info()
-        self.info.show()
+        self.info: Optional[Info] = None
+        if show_info_window:
+            self.info = Info()
+            self.info.show()
 
-        # info widget will also listen to key presses
-        self.info.keyPressEvent = self.keyPressEvent
+            # info widget will also listen to key presses
+            self.info.keyPressEvent = self.keyPressEvent
 
         if fullscreen:
             self.showFullScreen()
 
         # connect signals
         self.thread.change_video_signal.connect(self.update_image)
-        self.thread.change_info_signal.connect(self.info.update_info)
+        if self.info is not None:
+            self.thread.change_info_signal.connect(self.info.update_info)
         self.thread.change_presentation_sigal.connect(self.update_canvas)
         self.thread.finished.connect(self.closeAll)
         self.send_key_signal.connect(self.thread.set_key)
+        self.release_frame_signal.connect(self.thread.release_shown_frame)
 
         # start the thread
         self.thread.start()
@@ -719,15 +1158,23 @@ class App(QWidget):  # type: ignore
     def closeAll(self) -> None:
         logger.debug("Closing all QT windows")
         self.thread.stop()
-        self.info.deleteLater()
+        if self.info is not None:
+            self.info.deleteLater()
         self.deleteLater()
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         if not self.label.hasScaledContents():
-            self.pixmap = self.pixmap.scaled(
-                self.width(), self.height(), self.aspect_ratio.value, self.resize_mode
-            )
-            self.label.setPixmap(self.pixmap)
+            if self.image is not None:
+                # Frames are only sent when they change, so we rescale the last one
+                self.show_image()
+            else:
+                self.pixmap = self.pixmap.scaled(
+                    self.width(),
+                    self.height(),
+                    self.aspect_ratio.value,
+                    self.resize_mode,
+                )
+                self.label.setPixmap(self.pixmap)
         self.label.resize(self.width(), self.height())
 
     def closeEvent(self, event: QCloseEvent) -> None:
@@ -741,9 +1188,22 @@ class App(QWidget):  # type: ignore
         bytes_per_line = ch * w
         qt_img = QImage(cv_img.data, w, h, bytes_per_line, QImage.Format_BGR888)
 
-        if not self.label.hasScaledContents() and (
-            w != self.width() or h != self.height()
-        ):
+        if self.label.hasScaledContents():
+            self.label.setPixmap(QPixmap.fromImage(qt_img))
+        else:
+            # Copied out of the frame buffer, as it is rescaled on resize
+            self.image = qt_img.copy()
+            self.show_image()
+
+        # The pixmap holds its own copy, so the frame buffer can be reused
+        self.release_frame_signal.emit()
+
+    def show_image(self) -> None:
+        """Shows the last image, rescaled to fit the window."""
+        assert self.image is not None
+        qt_img = self.image
+
+        if qt_img.width() != self.width() or qt_img.height() != self.height():
             qt_img = qt_img.scaled(
                 self.width(), self.height(), self.aspect_ratio.value, self.resize_mode
             )
@@ -935,6 +1395,11 @@ def start_at_callback(
     is_flag=True,
     help="Hide mouse cursor.",
 )
+@click.option(
+    "--show-info-window",
+    is_flag=True,
+    help="Show a separate window with information about the current slide and animation.",
+)
 @click.option(
     "--aspect-ratio",
     type=click.Choice(ASPECT_RATIO_MODES.keys(), case_sensitive=False),
@@ -1009,6 +1474,7 @@ def present(
     record_to: Optional[Path],
     exit_after_last_slide: bool,
     hide_mouse: bool,
+    show_info_window: bool,
     aspect_ratio: str,
     resize_mode: str,
     background_color: Optional[str],
@@ -1081,6 +1547,7 @@ def present(
         record_to=record_to,
         exit_after_last_slide=exit_after_last_slide,
         hide_mouse=hide_mouse,
+        show_info_window=show_info_window,
         aspect_ratio=ASPECT_RATIO_MODES[aspect_ratio],
         resize_mode=RESIZE_MODES[resize_mode],
         start_at_scene_number=start_at_scene_number,
@@ -75,6 +75,8 @@ def test_merge_basenames(paths: List[Path]) -> None:
     path = merge_basenames(paths)
     assert path.suffix == paths[0].suffix
     assert path.parent == paths[0].parent
+    assert path == merge_basenames(paths)
+    assert path != merge_basenames(paths[::-1])
 
 
 class TestKey:
@@ -97,3 +99,20 @@ class TestPresentationConfig:
 
     def test_bump_to_json(self, presentation_config: PresentationConfig) -> None:
         _ = presentation_config.model_dump_json(indent=2)
+
+    def test_copy_to(
+        self, presentation_config: PresentationConfig, tmp_path: Path
+    ) -> None:
+        files = list(presentation_config.files)
+        files[0].write_text("new content")
+        (tmp_path / files[0].name).write_text("cached content")
+
+        config = presentation_config.copy_to(tmp_path)
+
+        assert config.files == [tmp_path / file.name for file in files]
+        assert all(file.exists() for file in config.files)
+        assert config.files[0].read_text() == "cached content"
+
+        presentation_config.files = files
+        config = presentation_config.copy_to(tmp_path, use_cached=False)
+        assert config.files[0].read_text() == "new content"
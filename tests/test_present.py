@@ -0,0 +1,236 @@
+from pathlib import Path
+from typing import List
+
+import cv2
+import numpy as np
+import pytest
+
+from manim_slides.config import PresentationConfig, SlideConfig, SlideType
+from manim_slides import present
+from manim_slides.present import (
+    Display,
+    FrameCache,
+    Presentation,
+    State,
+    grab_frames,
+)
+
+N_FRAMES = 10
+
+
+def frame(nbytes: int) -> np.ndarray:
+    return np.zeros(nbytes, dtype=np.uint8)
+
+
+def frame_value(frame: np.ndarray) -> int:
+    return int(round(frame.mean()))
+
+
+def write_video(path: Path, values: List[int]) -> Path:
+    """Writes a video whose frames are uniformly filled with given values."""
+    fourcc = cv2.VideoWriter_fourcc(*"MJPG")
+    out = cv2.VideoWriter(str(path), fourcc, 30, (64, 48))
+    for value in values:
+        out.write(np.full((48, 64, 3), value, dtype=np.uint8))
+    out.release()
+    return path
+
+
+@pytest.fixture
+def videos(tmp_path: Path) -> List[Path]:
+    return [
+        write_video(tmp_path / "a.avi", [20 * i for i in range(N_FRAMES)]),
+        write_video(tmp_path / "b.avi", [20 * i + 10 for i in range(N_FRAMES)]),
+    ]
+
+
+@pytest.fixture
+def presentation_config(videos: List[Path]) -> PresentationConfig:
+    return PresentationConfig(
+        slides=[
+            SlideConfig(
+                type=SlideType.loop, start_animation=0, end_animation=2, number=1
+            ),
+            SlideConfig(
+                type=SlideType.last, start_animation=2, end_animation=3, number=2
+            ),
+        ],
+        files=[*videos, videos[0]],
+    )
+
+
+class TestFrameCache:
+    def test_get(self) -> None:
+        cache = FrameCache(100)
+        frames = [frame(10), frame(10)]
+        cache.put("a", frames)
+
+        assert cache.get("a") is frames
+        assert cache.get("b") is None
+        assert cache.nbytes == 20
+
+    def test_put_replaces(self) -> None:
+        cache = FrameCache(100)
+        cache.put("a", [frame(60)])
+        frames = [frame(50)]
+        cache.put("a", frames)
+
+        assert cache.get("a") is frames
+        assert cache.nbytes == 50
+
+    def test_put_too_large(self) -> None:
+        cache = FrameCache(100)
+        cache.put("a", [frame(50)])
+        cache.put("b", [frame(60), frame(60)])
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.nbytes == 50
+
+    def test_eviction_order(self) -> None:
+        cache = FrameCache(100)
+        cache.put("a", [frame(40)])
+        cache.put("b", [frame(40)])
+        cache.put("c", [frame(40)])
+
+        assert cache.get("a") is None
+        assert list(cache.frames) == ["b", "c"]
+        assert cache.nbytes == 80
+
+    def test_get_refreshes(self) -> None:
+        cache = FrameCache(100)
+        cache.put("a", [frame(40)])
+        cache.put("b", [frame(40)])
+        _ = cache.get("a")
+        cache.put("c", [frame(40)])
+
+        assert cache.get("b") is None
+        assert list(cache.frames) == ["a", "c"]
+
+    def test_make_room_keeps_files(self) -> None:
+        cache = FrameCache(100)
+        cache.put("a", [frame(40)])
+        cache.put("b", [frame(40)])
+
+        assert not cache.make_room(70, keep={"a"})
+        assert list(cache.frames) == ["a", "b"]
+
+        assert cache.make_room(50, keep={"a"})
+        assert list(cache.frames) == ["a"]
+        assert cache.free_nbytes == 60
+
+
+def test_grab_frames(videos: List[Path]) -> None:
+    cap = cv2.VideoCapture(str(videos[0]))
+
+    assert grab_frames(cap, 3)
+    _, frame = cap.read()
+    assert frame_value(frame) == 20 * 3
+
+    assert not grab_frames(cap, N_FRAMES)
+    cap.release()
+
+
+class TestPresentation:
+    def test_read_frame_reuses_released_buffers(
+        self, presentation_config: PresentationConfig
+    ) -> None:
+        presentation = Presentation(presentation_config)
+        frames = []
+
+        for _ in range(3):
+            frame, _ = presentation.update_state(State.PLAYING)
+            presentation.use_frame(frame)
+            frames.append(frame)
+
+        # Buffers are never reused while shown, nor is the last frame
+        assert len({id(frame) for frame in frames}) == 3
+        presentation.release_frame(frames[0])
+        presentation.release_frame(frames[2])
+
+        frame, _ = presentation.update_state(State.PLAYING)
+        assert frame is frames[0]
+        assert frame_value(frame) == 20 * 3
+        assert frame_value(frames[1]) == 20 * 1
+
+    def test_release_cap_stops_prefetching(
+        self, presentation_config: PresentationConfig
+    ) -> None:
+        presentation = Presentation(presentation_config)
+        thread = presentation.prefetch_thread
+        assert thread is not None
+
+        presentation.release_cap()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert not presentation.caps
+
+        presentation.load_animation_cap(1)
+        assert presentation.prefetch_thread is not None
+        assert presentation.prefetch_thread.is_alive()
+        presentation.release_cap()
+
+    def test_loop_files_do_not_evict_each_other(
+        self,
+        presentation_config: PresentationConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Each file of the loop fits in the cache, but not both
+        cache = FrameCache(int(1.5 * N_FRAMES * 64 * 48 * 3))
+        monkeypatch.setattr(present, "FRAME_CACHE", cache)
+        cached_files = []
+        put = cache.put
+
+        def record_put(file: str, frames: List[np.ndarray]) -> None:
+            cached_files.append(file)
+            put(file, frames)
+
+        monkeypatch.setattr(cache, "put", record_put)
+        presentation = Presentation(presentation_config)
+
+        for _ in range(8 * N_FRAMES):
+            _ = presentation.update_state(State.PLAYING)
+
+        assert cached_files == [str(presentation_config.files[0])]
+        assert cache.get(cached_files[0]) is not None
+
+
+class TestDisplay:
+    def test_switching_presentations_releases_captures(
+        self, presentation_config: PresentationConfig
+    ) -> None:
+        presentations = [Presentation(presentation_config) for _ in range(2)]
+        display = Display(presentations)
+        assert presentations[0].caps and presentations[1].caps
+
+        display.current_presentation_index = 1
+        assert not presentations[0].caps
+        assert presentations[1].caps
+
+    def test_record_movie(
+        self,
+        presentation_config: PresentationConfig,
+        videos: List[Path],
+        tmp_path: Path,
+    ) -> None:
+        a, b = map(str, videos)
+        record_to = tmp_path / "out.avi"
+        display = Display([Presentation(presentation_config)], record_to=str(record_to))
+
+        # Frame numbers are one past the frame shown, and 0 before the first read
+        frame_numbers = [(a, 0), (a, 1), (a, 2), (a, 2), (a, 5), (a, 3), (b, 1), (b, 9)]
+        display.recordings = [(file, number, 30) for file, number in frame_numbers]
+        display.record_movie()
+
+        cap = cv2.VideoCapture(str(record_to))
+        values = []
+        while True:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            values.append(frame_value(frame))
+        cap.release()
+
+        expected = [0, 0, 20, 20, 80, 40, 10, 170]
+        assert len(values) == len(expected)
+        assert all(abs(value - e) <= 4 for value, e in zip(values, expected))